@@ -146,6 +146,7 @@ class SRV4PowerBoardHardwareBackend(
             i: False
             for i in range(2)
         }
+        self._firmware_version: Optional[int] = None
         self.check_firmware_version_supported()
 
     @handle_usb_error
@@ -189,9 +190,16 @@ class SRV4PowerBoardHardwareBackend(
 
     @property
     def firmware_version(self) -> int:
-        """The firmware version reported by the board."""
-        version, = struct.unpack("<I", self._read(CMD_READ_FWVER))
-        return cast(int, version)
+        """
+        The firmware version reported by the board.
+
+        The version is read when the backend is created to check that it is supported,
+        and cannot change while the device is open, so it is only read once.
+        """
+        if self._firmware_version is None:
+            version, = struct.unpack("<I", self._read(CMD_READ_FWVER))
+            self._firmware_version = cast(int, version)
+        return self._firmware_version
 
     @property  # type: ignore # https://github.com/python/mypy/issues/1362
     @handle_usb_error
@@ -1,8 +1,8 @@
 """Classes for the SR v4 Power Board."""
 
-from enum import Enum
-from time import sleep
-from typing import TYPE_CHECKING, List, Mapping, Optional, cast
+from enum import IntEnum
+from threading import Event, Thread
+from typing import TYPE_CHECKING, FrozenSet, List, Optional, Tuple, cast
 
 from j5.backends import Backend
 from j5.boards import Board
@@ -27,7 +27,7 @@ if TYPE_CHECKING:  # pragma: no cover
     from typing import Type  # noqa: F401
 
 
-class PowerOutputPosition(Enum):
+class PowerOutputPosition(IntEnum):
     """
     A mapping of name to number of the PowerBoard outputs.
 
@@ -42,6 +42,16 @@ class PowerOutputPosition(Enum):
     L3 = 5
 
 
+# This is a module-level constant so that a new collection is not built on every call.
+_SUPPORTED_COMPONENTS: FrozenSet["Type[Component]"] = frozenset({
+    PowerOutput,
+    Piezo,
+    Button,
+    BatterySensor,
+    LED,
+})
+
+
 class PowerBoard(Board):
     """Student Robotics v4 Power Board."""
 
@@ -49,24 +59,33 @@ class PowerBoard(Board):
         self._serial = serial
         self._backend = backend
 
-        self._outputs: Mapping[PowerOutputPosition, PowerOutput] = {
-            output: PowerOutput(
-                output.value, self, cast("PowerOutputInterface", self._backend),
-            )
+        # The firmware version cannot change while we are connected, so it is only
+        # fetched from the backend the first time that it is requested.
+        self._firmware_version: Optional[str] = None
+        self._firmware_version_fetched = False
+
+        # cast() only informs the type checker, so do it once per interface rather
+        # than once per component.
+        output_backend = cast("PowerOutputInterface", backend)
+        led_backend = cast("LEDInterface", backend)
+
+        # Outputs are stored in position order, so that they can be indexed by the
+        # value of their PowerOutputPosition. Note that in Python 3, Enums are ordered.
+        self._outputs: Tuple[PowerOutput, ...] = tuple(
+            PowerOutput(output.value, self, output_backend)
             for output in PowerOutputPosition
-            # Note that in Python 3, Enums are ordered.
-        }
+        )
 
         self._output_group = PowerOutputGroup(self._outputs)
 
-        self._piezo = Piezo(0, self, cast("PiezoInterface", self._backend))
-        self._start_button = Button(0, self, cast("ButtonInterface", self._backend))
+        self._piezo = Piezo(0, self, cast("PiezoInterface", backend))
+        self._start_button = Button(0, self, cast("ButtonInterface", backend))
         self._battery_sensor = BatterySensor(
-            0, self, cast("BatterySensorInterface", self._backend),
+            0, self, cast("BatterySensorInterface", backend),
         )
 
-        self._run_led = LED(0, self, cast("LEDInterface", self._backend))
-        self._error_led = LED(1, self, cast("LEDInterface", self._backend))
+        # The LEDs are numbered in the same order as they are unpacked here.
+        self._run_led, self._error_led = (LED(i, self, led_backend) for i in range(2))
 
     @property
     def name(self) -> str:
@@ -81,7 +100,10 @@ class PowerBoard(Board):
     @property
     def firmware_version(self) -> Optional[str]:
         """Get the firmware version of the board."""
-        return self._backend.get_firmware_version(self)
+        if not self._firmware_version_fetched:
+            self._firmware_version = self._backend.get_firmware_version(self)
+            self._firmware_version_fetched = True
+        return self._firmware_version
 
     @property
     def outputs(self) -> PowerOutputGroup:
@@ -108,20 +130,50 @@ class PowerBoard(Board):
         self._output_group.power_off()
 
     def wait_for_start_flash(self) -> None:
-        """Wait for the start button to be pressed and flash."""
-        counter = 0
-        led_state = False
-        while not self.start_button.is_pressed:
-            if counter % 6 == 0:
+        """
+        Wait for the start button to be pressed and flash.
+
+        The backend's wait for the button cannot be cancelled. If flashing stops early,
+        for example because setting the LED failed or the program was interrupted, the
+        backend carries on waiting for a press in a background thread until the button
+        is pressed or the program exits.
+        """
+        abandoned = Event()
+        errors: List[Exception] = []
+
+        def wait_for_press() -> None:
+            try:
+                self._start_button.wait_until_pressed()
+            except Exception as e:
+                if not abandoned.is_set():
+                    errors.append(e)
+
+        # Turn the run LED on before starting the wait, so that failing to talk to the
+        # board leaves nothing running.
+        led_state = True
+        self._run_led.state = led_state
+
+        waiter = Thread(target=wait_for_press, daemon=True)
+        waiter.start()
+        try:
+            # Flash the run LED until the button thread finishes.
+            waiter.join(0.3)
+            while waiter.is_alive():
                 led_state = not led_state
                 self._run_led.state = led_state
-            sleep(0.05)
-            counter += 1
+                waiter.join(0.3)
+        finally:
+            # Nobody will read errors from a wait that is still running.
+            if waiter.is_alive():
+                abandoned.set()
+
+        if errors:
+            raise errors[0]
 
     @staticmethod
-    def supported_components() -> List["Type[Component]"]:
-        """List the types of components supported by this board."""
-        return [PowerOutput, Piezo, Button, BatterySensor, LED]
+    def supported_components() -> FrozenSet["Type[Component]"]:
+        """Get the types of components supported by this board."""
+        return _SUPPORTED_COMPONENTS
 
     @staticmethod
     def discover(backend: Backend) -> List["Board"]:
@@ -1,7 +1,8 @@
 """Classes for Battery Sensing Components."""
 
 from abc import abstractmethod
-from typing import Type
+from time import monotonic
+from typing import Callable, Dict, Tuple, Type
 
 from j5.boards import Board
 from j5.components.component import Component, Interface
@@ -22,26 +23,73 @@ class BatterySensorInterface(Interface):
 
 
 class BatterySensor(Component):
-    """A sensor capable of monitoring a battery."""
+    """
+    A sensor capable of monitoring a battery.
+
+    Readings can optionally be cached for up to max_age seconds, so that code
+    which polls the sensor quickly does not need to talk to the hardware every time.
+    By default, every reading is fetched from the backend. max_age can be given when
+    the sensor is created, or set later on a sensor that belongs to a board.
+    """
+
+    __slots__ = ('_board', '_backend', '_identifier', '_max_age', '_cache')
 
     def __init__(
-        self, identifier: int, board: Board, backend: BatterySensorInterface,
+        self,
+        identifier: int,
+        board: Board,
+        backend: BatterySensorInterface,
+        max_age: float = 0,
     ) -> None:
         self._board = board
         self._backend = backend
         self._identifier = identifier
 
+        # Maps the name of a reading to the time it was taken and its value.
+        self._cache: Dict[str, Tuple[float, float]] = {}
+        self.max_age = max_age
+
     @staticmethod
     def interface_class() -> Type[BatterySensorInterface]:
         """Get the interface class that is required to use this component."""
         return BatterySensorInterface
 
+    @property
+    def max_age(self) -> float:
+        """Get how long a reading is cached for, in seconds."""
+        return self._max_age
+
+    @max_age.setter
+    def max_age(self, max_age: float) -> None:
+        """Set how long a reading is cached for, in seconds."""
+        if max_age < 0:
+            raise ValueError("max_age must be greater than or equal to zero.")
+        self._max_age = max_age
+        # Readings are not cached while max_age is zero, so any cached value may be
+        # older than a reading that has been made since.
+        self._cache.clear()
+
     @property
     def voltage(self) -> float:
         """Get the voltage of the battery sensor."""
-        return self._backend.get_battery_sensor_voltage(self._board, self._identifier)
+        return self._read("voltage", self._backend.get_battery_sensor_voltage)
 
     @property
     def current(self) -> float:
         """Get the current of the battery sensor."""
-        return self._backend.get_battery_sensor_current(self._board, self._identifier)
+        return self._read("current", self._backend.get_battery_sensor_current)
+
+    def _read(self, name: str, read_func: Callable[[Board, int], float]) -> float:
+        """Get a reading, using the cached value if it is recent enough."""
+        if self._max_age == 0:
+            return read_func(self._board, self._identifier)
+
+        now = monotonic()
+        if name in self._cache:
+            timestamp, value = self._cache[name]
+            if now - timestamp < self._max_age:
+                return value
+
+        value = read_func(self._board, self._identifier)
+        self._cache[name] = (now, value)
+        return value
@@ -24,6 +24,8 @@ class ButtonInterface(Interface):
 class Button(Component):
     """A button."""
 
+    __slots__ = ('_board', '_backend', '_identifier')
+
     def __init__(self, identifier: int, board: Board, backend: ButtonInterface) -> None:
         self._board = board
         self._backend = backend
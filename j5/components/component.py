@@ -11,6 +11,9 @@ class Interface(metaclass=ABCMeta):
 class Component(metaclass=ABCMeta):
     """A component is the smallest logical part of some hardware."""
 
+    # Subclasses declare their attributes in __slots__, so instances have no __dict__.
+    __slots__ = ()
+
     @staticmethod
     @abstractmethod
     def interface_class() -> Type[Interface]:
@@ -2,7 +2,7 @@
 
 from abc import abstractmethod
 from enum import IntEnum
-from typing import List, Optional, Type
+from typing import Collection, FrozenSet, List, Optional, Type
 
 from j5.boards import Board
 from j5.components.component import (
@@ -32,6 +32,20 @@ class GPIOPinMode(IntEnum):
     PWM_OUTPUT = 6  #: A PWM output signal can be created on the pin.
 
 
+_DIGITAL_READ_MODES: FrozenSet[GPIOPinMode] = frozenset({
+    GPIOPinMode.DIGITAL_OUTPUT,
+    GPIOPinMode.DIGITAL_INPUT,
+    GPIOPinMode.DIGITAL_INPUT_PULLUP,
+    GPIOPinMode.DIGITAL_INPUT_PULLDOWN,
+})
+_DIGITAL_WRITE_MODES: FrozenSet[GPIOPinMode] = frozenset({GPIOPinMode.DIGITAL_OUTPUT})
+_ANALOGUE_READ_MODES: FrozenSet[GPIOPinMode] = frozenset({GPIOPinMode.ANALOGUE_INPUT})
+_ANALOGUE_WRITE_MODES: FrozenSet[GPIOPinMode] = frozenset({
+    GPIOPinMode.ANALOGUE_OUTPUT,
+    GPIOPinMode.PWM_OUTPUT,
+})
+
+
 class GPIOPinInterface(Interface):
     """An interface containing the methods required for a GPIO Pin."""
 
@@ -97,6 +111,13 @@ class GPIOPinInterface(Interface):
 class GPIOPin(Component):
     """A GPIO Pin."""
 
+    __slots__ = (
+        '_board', '_backend', '_identifier', '_supported_modes', '_mode_cache',
+    )
+
+    # The last mode set on the pin, assigned by the mode setter.
+    _mode_cache: GPIOPinMode
+
     def __init__(
             self,
             identifier: int,
@@ -108,14 +129,15 @@ class GPIOPin(Component):
         self._board = board
         self._backend = backend
         self._identifier = identifier
-        self._supported_modes = supported_modes
+        # Stored as a frozenset, as it is checked every time that the mode is set.
+        self._supported_modes = frozenset(supported_modes)
 
         if len(supported_modes) < 1:
             raise ValueError("A GPIO pin must support at least one GPIOPinMode.")
 
         if initial_mode is None:
             # If no initial mode is set, choose the first supported mode.
-            initial_mode = self._supported_modes[0]
+            initial_mode = supported_modes[0]
         self.mode = initial_mode
 
     @staticmethod
@@ -123,17 +145,22 @@ class GPIOPin(Component):
         """Get the interface class that is required to use this component."""
         return GPIOPinInterface
 
-    def _require_pin_modes(self, pin_modes: List[GPIOPinMode]) -> None:
+    def _require_pin_modes(self, pin_modes: Collection[GPIOPinMode]) -> None:
         """Ensure that this pin is in the specified hardware mode."""
-        if not any(self.mode == mode for mode in pin_modes) and not len(pin_modes) == 0:
+        if pin_modes and self._mode_cache not in pin_modes:
             raise BadGPIOPinModeError(
                 f"Pin {self._identifier} needs to be in one of {pin_modes}",
             )
 
     @property
     def mode(self) -> GPIOPinMode:
-        """Get the hardware mode of this pin."""
-        return self._backend.get_gpio_pin_mode(self._board, self._identifier)
+        """
+        Get the hardware mode of this pin.
+
+        The mode is only ever changed through this component, so the last mode that
+        was set is returned without querying the backend.
+        """
+        return self._mode_cache
 
     @mode.setter
     def mode(self, pin_mode: GPIOPinMode) -> None:
@@ -144,16 +171,12 @@ class GPIOPin(Component):
                 does not support {str(pin_mode)}.",
             )
         self._backend.set_gpio_pin_mode(self._board, self._identifier, pin_mode)
+        self._mode_cache = pin_mode
 
     @property
     def digital_state(self) -> bool:
         """Get the digital state of the pin."""
-        self._require_pin_modes([
-            GPIOPinMode.DIGITAL_OUTPUT,
-            GPIOPinMode.DIGITAL_INPUT,
-            GPIOPinMode.DIGITAL_INPUT_PULLUP,
-            GPIOPinMode.DIGITAL_INPUT_PULLDOWN],
-        )
+        self._require_pin_modes(_DIGITAL_READ_MODES)
 
         # Behave differently depending on the hardware mode.
         if self.mode is GPIOPinMode.DIGITAL_OUTPUT:
@@ -164,22 +187,19 @@ class GPIOPin(Component):
     @digital_state.setter
     def digital_state(self, state: bool) -> None:
         """Set the digital state of the pin."""
-        self._require_pin_modes([GPIOPinMode.DIGITAL_OUTPUT])
+        self._require_pin_modes(_DIGITAL_WRITE_MODES)
         self._backend.write_gpio_pin_digital_state(self._board, self._identifier, state)
 
     @property
     def analogue_value(self) -> float:
         """Get the scaled analogue reading of the pin."""
-        self._require_pin_modes([GPIOPinMode.ANALOGUE_INPUT])
+        self._require_pin_modes(_ANALOGUE_READ_MODES)
         return self._backend.read_gpio_pin_analogue_value(self._board, self._identifier)
 
     @analogue_value.setter
     def analogue_value(self, new_value: float) -> None:
         """Set the analogue value of the pin."""
-        self._require_pin_modes([
-            GPIOPinMode.ANALOGUE_OUTPUT,
-            GPIOPinMode.PWM_OUTPUT,
-        ])
+        self._require_pin_modes(_ANALOGUE_WRITE_MODES)
         if new_value < 0 or new_value > 1:
             raise ValueError("An analogue pin value must be between 0 and 1.")
 
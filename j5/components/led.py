@@ -24,6 +24,8 @@ class LEDInterface(Interface):
 class LED(Component):
     """A standard Light Emitting Diode."""
 
+    __slots__ = ('_board', '_backend', '_identifier')
+
     def __init__(self, identifier: int, board: Board, backend: LEDInterface) -> None:
         self._board = board
         self._backend = backend
@@ -55,6 +55,8 @@ class PiezoInterface(Interface):
 class Piezo(Component):
     """A standard piezo."""
 
+    __slots__ = ('_board', '_backend', '_identifier')
+
     def __init__(self, identifier: int, board: Board, backend: PiezoInterface) -> None:
         self._board = board
         self._backend = backend
@@ -1,7 +1,8 @@
 """Classes for supporting toggleable power output channels."""
 
 from abc import abstractmethod
-from typing import Iterator, Mapping, Type, TypeVar
+from enum import Enum
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple, Type, Union
 
 from j5.boards import Board
 from j5.components.component import Component, Interface
@@ -22,6 +23,18 @@ class PowerOutputInterface(Interface):
         """Set whether a power output is enabled."""
         raise NotImplementedError  # pragma: no cover
 
+    def set_power_outputs_enabled(
+        self, board: Board, identifiers: Iterable[int], enabled: bool,
+    ) -> None:
+        """
+        Set whether several power outputs are enabled.
+
+        Backends that can change several outputs in one transaction should override
+        this. By default, each output is set individually.
+        """
+        for identifier in identifiers:
+            self.set_power_output_enabled(board, identifier, enabled)
+
     @abstractmethod
     def get_power_output_current(self, board: Board, identifier: int) -> float:
         """Get the current being drawn on a power output, in amperes."""
@@ -36,6 +49,8 @@ class PowerOutput(Component):
     measured.
     """
 
+    __slots__ = ('_identifier', '_board', '_backend')
+
     def __init__(
         self, identifier: int, board: Board, backend: PowerOutputInterface,
     ) -> None:
@@ -63,37 +78,58 @@ class PowerOutput(Component):
         """Get the current being drawn on this power output, in amperes."""
         return self._backend.get_power_output_current(self._board, self._identifier)
 
+    @staticmethod
+    def set_all_enabled(outputs: Iterable['PowerOutput'], enabled: bool) -> None:
+        """
+        Set whether several outputs are enabled, using one backend call per board.
+
+        Nothing requires the outputs to share a board, so they are batched by board
+        and backend.
+        """
+        batches: Dict[Tuple[PowerOutputInterface, Board], List[int]] = {}
+        for output in outputs:
+            key = (output._backend, output._board)
+            batches.setdefault(key, []).append(output._identifier)
 
-T = TypeVar('T')
+        for (backend, board), identifiers in batches.items():
+            backend.set_power_outputs_enabled(board, identifiers, enabled)
 
 
 class PowerOutputGroup:
-    """A group of PowerOutputs."""
+    """
+    A group of PowerOutputs.
+
+    Outputs can be looked up by their position in the group, or by an Enum member
+    whose value is that position.
+    """
 
-    def __init__(self, outputs: Mapping[T, PowerOutput]):
+    def __init__(self, outputs: Sequence[PowerOutput]):
         self._outputs = outputs
 
     def power_on(self) -> None:
         """Enable all outputs in the group."""
-        for output in self._outputs.values():
-            output.is_enabled = True
+        PowerOutput.set_all_enabled(self._outputs, True)
 
     def power_off(self) -> None:
         """Disable all outputs in the group."""
-        for output in self._outputs.values():
-            output.is_enabled = False
+        PowerOutput.set_all_enabled(self._outputs, False)
 
-    def __getitem__(self, index: T) -> PowerOutput:
+    def __getitem__(self, index: Union[int, Enum]) -> PowerOutput:
         """Get an output using list notation."""
-        return self._outputs[index]
+        position = index.value if isinstance(index, Enum) else index
+        # Only accept real positions in the group, rather than the negative indices and
+        # slices that a sequence would also accept.
+        if not isinstance(position, int) or not 0 <= position < len(self._outputs):
+            raise KeyError(index)
+        return self._outputs[position]
 
     def __iter__(self) -> Iterator[PowerOutput]:
         """
         Iterate over the outputs in the group.
 
-        The outputs are in no particular order.
+        The outputs are in the order that they were given to the group.
         """
-        return iter(self._outputs.values())
+        return iter(self._outputs)
 
     def __len__(self) -> int:
         """Get the number of outputs in the group."""
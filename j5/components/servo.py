@@ -32,6 +32,8 @@ class ServoInterface(Interface):
 class Servo(Component):
     """A standard servomotor."""
 
+    __slots__ = ('_board', '_backend', '_identifier')
+
     def __init__(self, identifier: int, board: Board, backend: ServoInterface) -> None:
         self._board = board
         self._backend = backend
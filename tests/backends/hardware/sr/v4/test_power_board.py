@@ -331,6 +331,16 @@ def test_backend_firmware_version():
     backend = SRV4PowerBoardHardwareBackend(device)
 
     assert backend.firmware_version == 3
+    assert backend.get_firmware_version(MockBoard()) == "3"
+
+
+def test_backend_firmware_version_cached():
+    """Test that the firmware version is only read from the device once."""
+    device = MockUSBPowerBoardDevice("SERIAL0")
+    backend = SRV4PowerBoardHardwareBackend(device)
+
+    device.firmware_version = 4
+    assert backend.firmware_version == 3
 
 
 def test_backend_bad_firmware_version():
@@ -415,6 +425,22 @@ def test_backend_get_button_state():
         backend.get_button_state(MockBoard(), 1)
 
 
+def test_backend_wait_until_button_pressed(monkeypatch):
+    """Test that we can wait until the button is pressed."""
+    device = MockUSBPowerBoardDevice("SERIAL0")
+    backend = SRV4PowerBoardHardwareBackend(device)
+    states = [False, False, False, True]
+    delays = []
+
+    monkeypatch.setattr(
+        "j5.backends.hardware.sr.v4.power_board.sleep", delays.append,
+    )
+    backend.get_button_state = lambda board, identifier: states.pop(0)
+    backend.wait_until_button_pressed(MockBoard(), 0)
+    assert states == []
+    assert delays == [0.05, 0.05, 0.05]
+
+
 def test_backend_get_battery_sensor_voltage():
     """Test that we can get the battery sensor voltage."""
     device = MockUSBPowerBoardDevice("SERIAL0")
@@ -1,8 +1,11 @@
 """Tests for the SR v4 Power Board and related classes."""
 from datetime import timedelta
+from threading import Event
 from typing import Optional
 
-from j5.backends import Backend, Environment
+import pytest
+
+from j5.backends import Backend, CommunicationError, Environment
 from j5.boards import Board
 from j5.boards.sr.v4 import PowerBoard, PowerOutputGroup, PowerOutputPosition
 from j5.components import (
@@ -113,6 +116,31 @@ def test_power_board_serial():
     assert pb.serial == "SERIAL0"
 
 
+def test_power_board_firmware_version():
+    """Test that the firmware version is only fetched from the backend once."""
+    backend = MockPowerBoardBackend()
+    pb = PowerBoard("SERIAL0", backend)
+    calls = []
+
+    def get_firmware_version(board: Board) -> Optional[str]:
+        calls.append(board)
+        return "3"
+
+    backend.get_firmware_version = get_firmware_version
+
+    assert pb.firmware_version == "3"
+    assert pb.firmware_version == "3"
+    assert calls == [pb]
+
+
+def test_power_board_supported_components():
+    """Test the supported components of the PowerBoard."""
+    supported = PowerBoard.supported_components()
+
+    assert supported == {PowerOutput, Piezo, Button, BatterySensor, LED}
+    assert PowerBoard.supported_components() is supported
+
+
 def test_power_board_make_safe():
     """Test the make_safe method of the PowerBoard."""
     pb = PowerBoard("SERIAL0", MockPowerBoardBackend())
@@ -127,6 +155,8 @@ def test_power_board_outputs():
     assert len(pb.outputs) == 6
 
     assert type(pb.outputs[PowerOutputPosition.H0])
+    assert pb.outputs[PowerOutputPosition.L1] is pb.outputs[3]
+    assert PowerOutputPosition.L1 == 3
 
     for output in pb.outputs:
         assert type(output) is PowerOutput
@@ -152,12 +182,18 @@ def test_power_board_battery_sensor():
 
     assert type(pb.battery_sensor) is BatterySensor
 
+    # Readings are uncached unless the user opts in.
+    assert pb.battery_sensor.max_age == 0
+    pb.battery_sensor.max_age = 0.1
+    assert pb.battery_sensor.max_age == 0.1
+
 
 def test_power_board_run_led():
     """Test the run LED on the Power Board."""
     pb = PowerBoard("SERIAL0", MockPowerBoardBackend())
 
     assert type(pb._run_led) is LED
+    assert pb._run_led._identifier == 0
 
 
 def test_power_board_error_led():
@@ -165,3 +201,79 @@ def test_power_board_error_led():
     pb = PowerBoard("SERIAL0", MockPowerBoardBackend())
 
     assert type(pb._error_led) is LED
+    assert pb._error_led._identifier == 1
+
+
+def test_power_board_wait_for_start_flash():
+    """Test that wait_for_start_flash returns once the button is pressed."""
+    pb = PowerBoard("SERIAL0", MockPowerBoardBackend())
+    pb.wait_for_start_flash()
+
+
+def test_power_board_wait_for_start_flash_led():
+    """Test that the run LED flashes while waiting for the start button."""
+    backend = MockPowerBoardBackend()
+    led_states = []
+    led_flashed = Event()
+
+    def set_led_state(board: Board, identifier: int, state: bool) -> None:
+        led_states.append((identifier, state))
+        if len(led_states) == 2:
+            led_flashed.set()
+
+    def wait_until_button_pressed(board: Board, identifier: int) -> None:
+        # Press the button once the LED has been turned on and off again.
+        assert led_flashed.wait(5)
+
+    backend.set_led_state = set_led_state
+    backend.wait_until_button_pressed = wait_until_button_pressed
+    pb = PowerBoard("SERIAL0", backend)
+    pb.wait_for_start_flash()
+
+    assert led_states[:2] == [(0, True), (0, False)]
+
+
+def test_power_board_wait_for_start_flash_led_on():
+    """Test that the run LED is turned on before the first flash interval."""
+    backend = MockPowerBoardBackend()
+    led_states = []
+
+    def set_led_state(board: Board, identifier: int, state: bool) -> None:
+        led_states.append((identifier, state))
+
+    backend.set_led_state = set_led_state
+    pb = PowerBoard("SERIAL0", backend)
+    pb.wait_for_start_flash()
+
+    assert led_states == [(0, True)]
+
+
+def test_power_board_wait_for_start_flash_error():
+    """Test that errors waiting for the start button are raised to the caller."""
+    backend = MockPowerBoardBackend()
+
+    def wait_until_button_pressed(board: Board, identifier: int) -> None:
+        raise CommunicationError("Button read failed.")
+
+    backend.wait_until_button_pressed = wait_until_button_pressed
+    pb = PowerBoard("SERIAL0", backend)
+
+    with pytest.raises(CommunicationError):
+        pb.wait_for_start_flash()
+
+
+def test_power_board_wait_for_start_flash_led_error():
+    """Test that the button is not waited for if the run LED cannot be set."""
+    backend = MockPowerBoardBackend()
+    waits = []
+
+    def set_led_state(board: Board, identifier: int, state: bool) -> None:
+        raise CommunicationError("LED write failed.")
+
+    backend.set_led_state = set_led_state
+    backend.wait_until_button_pressed = lambda board, identifier: waits.append(identifier)
+    pb = PowerBoard("SERIAL0", backend)
+
+    with pytest.raises(CommunicationError):
+        pb.wait_for_start_flash()
+    assert waits == []
@@ -0,0 +1,273 @@
+"""
+Mock drivers, mock boards and fixtures shared by the component tests.
+
+The mock boards hold no state, so a single instance of each is shared by every test.
+Tests must not modify them.
+"""
+from array import array
+from typing import List, Optional, Type
+
+import pytest
+
+from j5.backends import Backend
+from j5.boards import Board
+from j5.components import Component
+from j5.components.gpio_pin import GPIOPin, GPIOPinInterface, GPIOPinMode
+from j5.components.led import LED, LEDInterface
+from j5.components.power_output import PowerOutput, PowerOutputInterface
+
+ALL_GPIO_PIN_MODES = tuple(GPIOPinMode)
+
+
+class MockGPIOPinDriver(GPIOPinInterface):
+    """A testing driver for the GPIO pin component."""
+
+    def __init__(self):
+        self.pin_count: int = 10
+        # Modes are stored as the value of their GPIOPinMode, one byte per pin.
+        self._mode = array('B', [GPIOPinMode.DIGITAL_OUTPUT.value] * self.pin_count)
+
+        # Digital states are stored as one byte per pin, with 0 meaning False.
+        self._written_digital_state = bytearray(self.pin_count)
+        self._digital_state = bytearray(self.pin_count)
+
+    def reset(self) -> None:
+        """Return every pin to its initial state, in place."""
+        self._mode[:] = array('B', [GPIOPinMode.DIGITAL_OUTPUT.value] * self.pin_count)
+        self._written_digital_state[:] = bytes(self.pin_count)
+        self._digital_state[:] = bytes(self.pin_count)
+
+    def set_gpio_pin_mode(self, board: Board, identifier: int, pin_mode: GPIOPinMode):
+        """Set the hardware mode of a pin."""
+        self._mode[identifier] = pin_mode.value
+
+    def get_gpio_pin_mode(self, board: Board, identifier: int) -> GPIOPinMode:
+        """Get the hardware mode of a GPIO pin."""
+        return GPIOPinMode(self._mode[identifier])
+
+    def write_gpio_pin_digital_state(self, board: Board, identifier: int, state: bool):
+        """Write to the digital state of a GPIO pin."""
+        self._written_digital_state[identifier] = state
+
+    def get_gpio_pin_digital_state(self, board: Board, identifier: int):
+        """Get the last written state of the GPIO pin."""
+        return bool(self._written_digital_state[identifier])
+
+    def read_gpio_pin_digital_state(self, board: Board, identifier: int):
+        """Read the digital state of the GPIO pin."""
+        return bool(self._digital_state[identifier])
+
+    def read_gpio_pin_analogue_value(self, board: Board, identifier: int) -> float:
+        """Read the scaled analogue value of the GPIO pin."""
+        return 0.6
+
+    def write_gpio_pin_dac_value(
+            self,
+            board: Board,
+            identifier: int,
+            scaled_value: float,
+    ) -> None:
+        """Write a scaled analogue value to the DAC on the GPIO pin."""
+        pass
+
+    def write_gpio_pin_pwm_value(
+            self,
+            board: Board,
+            identifier: int,
+            duty_cycle: float,
+    ) -> None:
+        """Write a scaled analogue value to the PWM on the GPIO pin."""
+        pass
+
+
+class MockGPIOPinBoard(Board):
+    """A testing board for the GPIO pin."""
+
+    @property
+    def name(self) -> str:
+        """The name of this board."""
+        return "Testing GPIO Pin Board"
+
+    @property
+    def serial(self) -> str:
+        """The serial number of this board."""
+        return "SERIAL"
+
+    @property
+    def firmware_version(self) -> Optional[str]:
+        """Get the firmware version of this board."""
+        return None
+
+    def make_safe(self):
+        """Make this board safe."""
+        pass
+
+    @staticmethod
+    def supported_components() -> List[Type[Component]]:
+        """List the types of component that this Board supports."""
+        return [GPIOPin]
+
+    @staticmethod
+    def discover(backend: Backend) -> List[Board]:
+        """Detect all of the boards on a given backend."""
+        return []
+
+
+class MockLEDDriver(LEDInterface):
+    """A testing driver for the led."""
+
+    def set_led_state(self, board: Board, identifier: int, state: bool) -> None:
+        """Set the state of an led."""
+        pass
+
+    def get_led_state(self, board: Board, identifier: int) -> bool:
+        """Get the state of an LED."""
+        return True
+
+
+class MockLEDBoard(Board):
+    """A testing board for the led."""
+
+    @property
+    def name(self) -> str:
+        """The name of this board."""
+        return "Testing LED Board"
+
+    @property
+    def serial(self) -> str:
+        """The serial number of this board."""
+        return "SERIAL"
+
+    @property
+    def firmware_version(self) -> Optional[str]:
+        """Get the firmware version of this board."""
+        return self._backend.get_firmware_version(self)
+
+    @property
+    def supported_components(self) -> List[Type[Component]]:
+        """List the types of component that this Board supports."""
+        return [LED]
+
+    def make_safe(self):
+        """Make this board safe."""
+        pass
+
+    @staticmethod
+    def discover(backend: Backend):
+        """Detect all of the boards on a given backend."""
+        return []
+
+
+class MockPowerOutputDriver(PowerOutputInterface):
+    """A testing driver for power outputs."""
+
+    def __init__(self):
+        self._enabled = False
+
+    def get_power_output_enabled(self, board: Board, identifier: int) -> bool:
+        """Get whether a power output is enabled."""
+        return self._enabled
+
+    def set_power_output_enabled(
+        self, board: Board, identifier: int, enabled: bool,
+    ) -> None:
+        """Set whether a power output is enabled."""
+        self._enabled = enabled
+
+    def get_power_output_current(self, board: Board, identifier: int) -> float:
+        """Get the current being drawn on a power output, in amperes."""
+        return 8.1
+
+
+class MockPowerOutputBoard(Board):
+    """A testing board for the power output."""
+
+    @property
+    def name(self) -> str:
+        """The name of this board."""
+        return "Testing Power Output Board"
+
+    @property
+    def serial(self) -> str:
+        """The serial number of this board."""
+        return "SERIAL"
+
+    @property
+    def firmware_version(self) -> Optional[str]:
+        """Get the firmware version of this board."""
+        return self._backend.get_firmware_version(self)
+
+    @property
+    def supported_components(self) -> List[Type[Component]]:
+        """List the types of component that this Board supports."""
+        return [PowerOutput]
+
+    def make_safe(self):
+        """Make this board safe."""
+        pass
+
+    @staticmethod
+    def discover(backend: Backend):
+        """Detect all of the boards on a given backend."""
+        return []
+
+
+@pytest.fixture(scope="module")
+def _shared_gpio_driver():
+    """A GPIO pin driver, shared by the tests in a module."""
+    return MockGPIOPinDriver()
+
+
+@pytest.fixture
+def mock_gpio_driver(_shared_gpio_driver):
+    """The shared GPIO pin driver, returned to its initial state for each test."""
+    _shared_gpio_driver.reset()
+    return _shared_gpio_driver
+
+
+@pytest.fixture(scope="session")
+def mock_gpio_board():
+    """A board for GPIO pins to belong to."""
+    return MockGPIOPinBoard()
+
+
+@pytest.fixture
+def make_pin(mock_gpio_driver, mock_gpio_board):
+    """
+    A factory for GPIO pins on the mock board and driver.
+
+    Keyword arguments are passed on to GPIOPin.
+    """
+    def _make_pin(identifier=0, **kwargs):
+        return GPIOPin(identifier, mock_gpio_board, mock_gpio_driver, **kwargs)
+    return _make_pin
+
+
+@pytest.fixture
+def all_modes_pin(make_pin):
+    """A GPIO pin that supports every GPIOPinMode."""
+    return make_pin(supported_modes=ALL_GPIO_PIN_MODES)
+
+
+@pytest.fixture
+def mock_led_driver():
+    """An LED driver."""
+    return MockLEDDriver()
+
+
+@pytest.fixture(scope="session")
+def mock_led_board():
+    """A board for LEDs to belong to."""
+    return MockLEDBoard()
+
+
+@pytest.fixture
+def mock_power_output_driver():
+    """A power output driver with its output disabled."""
+    return MockPowerOutputDriver()
+
+
+@pytest.fixture(scope="session")
+def mock_power_output_board():
+    """A board for power outputs to belong to."""
+    return MockPowerOutputBoard()
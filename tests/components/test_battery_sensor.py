@@ -1,6 +1,8 @@
 """Tests for the Battery Sensor Classes."""
 from typing import List, Optional, Type
 
+import pytest
+
 from j5.backends import Backend
 from j5.boards import Board
 from j5.components import Component
@@ -79,3 +81,60 @@ def test_battery_sensor_current():
     battery = BatterySensor(0, MockBatterySensorBoard(), MockBatterySensorDriver())
     assert type(battery.current) is float
     assert battery.current == 2.0
+
+
+def test_battery_sensor_max_age(monkeypatch):
+    """Test that readings are cached for max_age seconds."""
+    now = 100.0
+    monkeypatch.setattr("j5.components.battery_sensor.monotonic", lambda: now)
+
+    driver = MockBatterySensorDriver()
+    battery = BatterySensor(0, MockBatterySensorBoard(), driver, max_age=1)
+    assert battery.max_age == 1
+    assert battery.voltage == 5.0
+    assert battery.current == 2.0
+
+    driver.get_battery_sensor_voltage = lambda board, identifier: 6.0
+    driver.get_battery_sensor_current = lambda board, identifier: 3.0
+    now = 100.5
+    assert battery.voltage == 5.0
+    assert battery.current == 2.0
+
+    # Once max_age has passed, the backend is read again.
+    now = 101.0
+    assert battery.voltage == 6.0
+    assert battery.current == 3.0
+
+
+def test_battery_sensor_max_age_default(monkeypatch):
+    """Test that readings are not cached by default."""
+    def monotonic():
+        raise AssertionError("The clock should not be read when caching is off.")
+    monkeypatch.setattr("j5.components.battery_sensor.monotonic", monotonic)
+
+    driver = MockBatterySensorDriver()
+    battery = BatterySensor(0, MockBatterySensorBoard(), driver)
+    assert battery.max_age == 0
+    assert battery.voltage == 5.0
+
+    driver.get_battery_sensor_voltage = lambda board, identifier: 6.0
+    assert battery.voltage == 6.0
+
+
+def test_battery_sensor_max_age_setter():
+    """Test that max_age can be set after the sensor is created."""
+    driver = MockBatterySensorDriver()
+    battery = BatterySensor(0, MockBatterySensorBoard(), driver)
+    battery.max_age = 60
+    assert battery.voltage == 5.0
+
+    driver.get_battery_sensor_voltage = lambda board, identifier: 6.0
+    assert battery.voltage == 5.0
+
+    # Changing max_age drops the cached readings.
+    battery.max_age = 0
+    battery.max_age = 60
+    assert battery.voltage == 6.0
+
+    with pytest.raises(ValueError):
+        battery.max_age = -1
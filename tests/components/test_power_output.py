@@ -1,90 +1,111 @@
 """Tests for the power output classes."""
-from typing import List, Optional, Type
+from enum import Enum
 
-from j5.backends import Backend
-from j5.boards import Board
-from j5.components.power_output import PowerOutput, PowerOutputInterface
+import pytest
 
+from j5.components.power_output import (
+    PowerOutput,
+    PowerOutputGroup,
+    PowerOutputInterface,
+)
 
-class MockPowerOutputDriver(PowerOutputInterface):
-    """A testing driver for power outputs."""
 
-    def __init__(self):
-        self._enabled = False
+def test_power_output_interface_implementation(mock_power_output_driver):
+    """Test that we can implement the PowerOutputInterface."""
+    assert isinstance(mock_power_output_driver, PowerOutputInterface)
 
-    def get_power_output_enabled(self, board: Board, identifier: int) -> bool:
-        """Get whether a power output is enabled."""
-        return self._enabled
 
-    def set_power_output_enabled(
-        self, board: Board, identifier: int, enabled: bool,
-    ) -> None:
-        """Set whether a power output is enabled."""
-        self._enabled = enabled
+def test_power_output_instantiation(mock_power_output_driver, mock_power_output_board):
+    """Test that we can instantiate a PowerOutput."""
+    PowerOutput(0, mock_power_output_board, mock_power_output_driver)
 
-    def get_power_output_current(self, board: Board, identifier: int) -> float:
-        """Get the current being drawn on a power output, in amperes."""
-        return 8.1
 
+def test_power_output_interface():
+    """Test that the class returns the correct interface."""
+    assert PowerOutput.interface_class() is PowerOutputInterface
 
-class MockPowerOutputBoard(Board):
-    """A testing board for the power output."""
 
-    @property
-    def name(self) -> str:
-        """The name of this board."""
-        return "Testing Power Output Board"
+def test_power_output_enabled(mock_power_output_driver, mock_power_output_board):
+    """Test the is_enabled property of a PowerOutput."""
+    power_output = PowerOutput(0, mock_power_output_board, mock_power_output_driver)
+    assert power_output.is_enabled is False
+    power_output.is_enabled = True
+    assert power_output.is_enabled is True
 
-    @property
-    def serial(self) -> str:
-        """The serial number of this board."""
-        return "SERIAL"
 
-    @property
-    def firmware_version(self) -> Optional[str]:
-        """Get the firmware version of this board."""
-        return self._backend.get_firmware_version(self)
+def test_power_output_current(mock_power_output_driver, mock_power_output_board):
+    """Test the current property of a PowerOutput."""
+    power_output = PowerOutput(0, mock_power_output_board, mock_power_output_driver)
+    assert type(power_output.current) is float
+    assert power_output.current == 8.1
 
-    @property
-    def supported_components(self) -> List[Type["Component"]]:
-        """List the types of component that this Board supports."""
-        return [PowerOutput]
 
-    def make_safe(self):
-        """Make this board safe."""
-        pass
+def test_power_output_group_power_on_off(
+    mock_power_output_driver, mock_power_output_board,
+):
+    """Test that a PowerOutputGroup sets all of its outputs at once."""
+    driver = mock_power_output_driver
+    board = mock_power_output_board
+    calls = []
 
-    @staticmethod
-    def discover(backend: Backend):
-        """Detect all of the boards on a given backend."""
-        return []
+    def set_power_outputs_enabled(board, identifiers, enabled):
+        calls.append((board, list(identifiers), enabled))
 
+    driver.set_power_outputs_enabled = set_power_outputs_enabled
+    group = PowerOutputGroup([PowerOutput(i, board, driver) for i in range(3)])
 
-def test_power_output_interface_implementation():
-    """Test that we can implement the PowerOutputInterface."""
-    MockPowerOutputDriver()
+    group.power_on()
+    group.power_off()
+    assert calls == [(board, [0, 1, 2], True), (board, [0, 1, 2], False)]
 
 
-def test_power_output_instantiation():
-    """Test that we can instantiate a PowerOutput."""
-    PowerOutput(0, MockPowerOutputBoard(), MockPowerOutputDriver())
+def test_power_output_set_power_outputs_enabled(
+    mock_power_output_driver, mock_power_output_board,
+):
+    """Test the default implementation of setting several outputs."""
+    mock_power_output_driver.set_power_outputs_enabled(
+        mock_power_output_board, [0, 1], True,
+    )
+    assert mock_power_output_driver._enabled is True
 
 
-def test_power_output_interface():
-    """Test that the class returns the correct interface."""
-    assert PowerOutput.interface_class() is PowerOutputInterface
+def test_power_output_set_all_enabled(mock_power_output_driver, mock_power_output_board):
+    """Test that outputs are batched by board when set together."""
+    other_board = type(mock_power_output_board)()
+    calls = []
 
+    def set_power_outputs_enabled(board, identifiers, enabled):
+        calls.append((board, list(identifiers), enabled))
 
-def test_power_output_enabled():
-    """Test the is_enabled property of a PowerOutput."""
-    power_output = PowerOutput(0, MockPowerOutputBoard(), MockPowerOutputDriver())
-    assert power_output.is_enabled is False
-    power_output.is_enabled = True
-    assert power_output.is_enabled is True
+    mock_power_output_driver.set_power_outputs_enabled = set_power_outputs_enabled
+    outputs = [
+        PowerOutput(0, mock_power_output_board, mock_power_output_driver),
+        PowerOutput(0, other_board, mock_power_output_driver),
+        PowerOutput(1, mock_power_output_board, mock_power_output_driver),
+    ]
 
+    PowerOutput.set_all_enabled(outputs, True)
+    assert calls == [
+        (mock_power_output_board, [0, 1], True),
+        (other_board, [0], True),
+    ]
 
-def test_power_output_current():
-    """Test the current property of a PowerOutput."""
-    power_output = PowerOutput(0, MockPowerOutputBoard(), MockPowerOutputDriver())
-    assert type(power_output.current) is float
-    assert power_output.current == 8.1
+
+def test_power_output_group_getitem(mock_power_output_driver, mock_power_output_board):
+    """Test looking up outputs in a PowerOutputGroup."""
+    class Position(Enum):
+        FIRST = 0
+        SECOND = 1
+
+    outputs = [
+        PowerOutput(i, mock_power_output_board, mock_power_output_driver)
+        for i in range(2)
+    ]
+    group = PowerOutputGroup(outputs)
+
+    assert group[0] is outputs[0]
+    assert group[Position.SECOND] is outputs[1]
+
+    for index in (-1, 2, slice(0, 2)):
+        with pytest.raises(KeyError):
+            group[index]
@@ -39,15 +39,15 @@ if __name__ == '__main__':
     print(f"Battery current: {r.power_board.battery_sensor.current} A")
 
     for output in PowerOutputPosition:
-        print(f"Output {output} on.")
+        print(f"Output {output.name} on.")
         r.power_board.outputs[output].is_enabled = True
         sleep(0.5)
 
     for output in PowerOutputPosition:
-        print(f"Output {str(output)} current: {r.power_board.outputs[output].current} A")
+        print(f"Output {output.name} current: {r.power_board.outputs[output].current} A")
 
     for output in PowerOutputPosition:
-        print(f"Output {output} off.")
+        print(f"Output {output.name} off.")
         r.power_board.outputs[output].is_enabled = False
         sleep(0.5)
 